@@ -15,6 +15,8 @@ from yarl import URL
 from .crypto import generate_nonce, get_client_proof
 
 TIMEOUT: Final = 5.0
+CONNECTION_LIMIT: Final = 10
+KEEPALIVE_TIMEOUT: Final = 75.0
 
 SESSION_COOKIE_NAME: Final = "SessionID_R3"
 
@@ -32,6 +34,20 @@ AUTH_FAILURE_CREDENTIALS: Final = "auth_invalid_credentials"
 AUTH_FAILURE_CSRF: Final = "auth_invalid_csrf"
 AUTH_FAILURE_TOO_MANY_USERS: Final = "auth_too_many_users"
 
+_LOGGER = logging.getLogger(__name__)
+
+
+# ---------------------------
+#   HostLoggerAdapter
+# ---------------------------
+class HostLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that attaches the router host to the log records."""
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        """Prefix the message with the host and add the host to the record extra."""
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        return f"({self.extra['host']}) {msg}", kwargs
+
 
 # ---------------------------
 #   AuthenticationError
@@ -191,7 +207,7 @@ class HuaweiCoreApi:
         verify_ssl: bool,
     ) -> None:
         """Initialize."""
-        self._logger = logging.getLogger(f"{__name__} ({host})")
+        self._logger = HostLoggerAdapter(_LOGGER, {"host": host})
         self._logger.debug("New instance of HuaweiCoreApi created")
         self._user: str = user
         self._password: str = password
@@ -310,7 +326,10 @@ class HuaweiCoreApi:
         if self._session is None:
             """Unsafe cookies for IP addresses instead of domain names"""
             jar = aiohttp.CookieJar(unsafe=True)
-            self._session = aiohttp.ClientSession(cookie_jar=jar)
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT, keepalive_timeout=KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(cookie_jar=jar, connector=connector)
             self._logger.debug("Session created")
         self._session.cookie_jar.clear()
         self._active_csrf = None
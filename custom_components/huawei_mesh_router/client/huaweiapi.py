@@ -1,8 +1,9 @@
 """Huawei api extended functions."""
 
-from functools import wraps
+import asyncio
 import logging
-from typing import Any, Final, Iterable, Tuple
+import time
+from typing import Any, Awaitable, Callable, Final, Iterable, NamedTuple, Tuple
 
 from aiohttp import ClientResponse
 
@@ -16,7 +17,12 @@ from .classes import (
     HuaweiFilterInfo,
     HuaweiRouterInfo,
 )
-from .coreapi import APICALL_ERRCAT_UNAUTHORIZED, ApiCallError, HuaweiCoreApi
+from .coreapi import (
+    APICALL_ERRCAT_UNAUTHORIZED,
+    ApiCallError,
+    HostLoggerAdapter,
+    HuaweiCoreApi,
+)
 
 SWITCH_NFC: Final = "nfc_switch"
 SWITCH_WIFI_80211R: Final = "wifi_80211r_switch"
@@ -44,35 +50,130 @@ _URL_WLAN_FILTER: Final = "api/ntwk/wlanfilterenhance"
 
 _STATUS_CONNECTED: Final = "Connected"
 
+_FILTER_STATES_CACHE_TTL: Final = 2.0
+
 _LOGGER = logging.getLogger(__name__)
 
 
+# ---------------------------
+#   _gather_all
+# ---------------------------
+async def _gather_all(*aws: Awaitable[Any]) -> list[Any]:
+    """Await all awaitables and raise the first error once all of them are done."""
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+# ---------------------------
+#   _index_by_mac
+# ---------------------------
+def _index_by_mac(items: list[dict[str, Any]]) -> dict[MAC_ADDR, int]:
+    """Return the position of the first item for each mac address."""
+    index: dict[MAC_ADDR, int] = {}
+    for position, item in enumerate(items):
+        index.setdefault(item.get("MACAddress"), position)
+    return index
+
+
+# ---------------------------
+#   _first_wifi_config
+# ---------------------------
+def _first_wifi_config(data: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the first item of the WifiConfig list if any."""
+    configs = data.get("WifiConfig")
+    return configs[0] if configs else None
+
+
+# ---------------------------
+#   _has_wifi_config_value
+# ---------------------------
+def _has_wifi_config_value(data: dict[str, Any], key: str) -> bool:
+    """Return true if the first WifiConfig item has the setting."""
+    config = _first_wifi_config(data)
+    return config is not None and config.get(key) is not None
+
+
+# ---------------------------
+#   _read_wifi_config_flag
+# ---------------------------
+def _read_wifi_config_flag(data: dict[str, Any], key: str) -> bool:
+    """Return the boolean setting of the first WifiConfig item."""
+    config = _first_wifi_config(data)
+    setting_value = config and config.get(key)
+    return isinstance(setting_value, bool) and setting_value
+
+
+# ---------------------------
+#   _find_filter_states
+# ---------------------------
+def _find_filter_states(
+    actual_states: Iterable[dict[str, Any]],
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Return the (2.4GHz, 5GHz) filter states."""
+    state_2g = None
+    state_5g = None
+    for state in actual_states:
+        frequency = state.get("FrequencyBand")
+        if frequency == "2.4GHz":
+            state_2g = state
+        elif frequency == "5GHz":
+            state_5g = state
+        if state_2g is not None and state_5g is not None:
+            break
+    return state_2g, state_5g
+
+
+# ---------------------------
+#   _read_wlan_filter_state
+# ---------------------------
+def _read_wlan_filter_state(data: Iterable[dict[str, Any]]) -> bool:
+    """Return true if filtering is enabled for the 5GHz band."""
+    _, state_5g = _find_filter_states(data)
+    return HuaweiFilterInfo.parse(state_5g).enabled
+
+
+# ---------------------------
+#   _build_band_config
+# ---------------------------
+def _build_band_config(state: dict[str, Any], **overrides: Any) -> dict[str, Any]:
+    """Return the band filter config built from the actual state and overrides."""
+    config = {
+        "MACAddressControlEnabled": state.get("MACAddressControlEnabled"),
+        "WMacFilters": state.get("WMACAddresses"),
+        "ID": state.get("ID"),
+        "MacFilterPolicy": state.get("MacFilterPolicy"),
+        "BMacFilters": state.get("BMACAddresses"),
+        "FrequencyBand": state.get("FrequencyBand"),
+    }
+    config.update(overrides)
+    return config
+
+
+# ---------------------------
+#   _SwitchDefinition
+# ---------------------------
+class _SwitchDefinition(NamedTuple):
+    feature: str
+    url: str
+    read_state: Callable[[Any], bool]
+    write_state: Callable[["HuaweiApi", bool], Awaitable[Any]]
+
+
 # ---------------------------
 #   UnsupportedActionError
 # ---------------------------
 class UnsupportedActionError(Exception):
-    def __init__(self, message: str) -> None:
-        """Initialize."""
-        super().__init__(message)
-        self._message = message
-
-    def __str__(self, *args, **kwargs) -> str:
-        """Return str(self)."""
-        return self._message
+    __slots__ = ()
 
 
 # ---------------------------
 #   InvalidActionError
 # ---------------------------
 class InvalidActionError(Exception):
-    def __init__(self, message: str) -> None:
-        """Initialize."""
-        super().__init__(message)
-        self._message = message
-
-    def __str__(self, *args, **kwargs) -> str:
-        """Return str(self)."""
-        return self._message
+    __slots__ = ()
 
 
 # ---------------------------
@@ -82,82 +183,108 @@ class HuaweiFeaturesDetector:
     def __init__(self, core_api: HuaweiCoreApi):
         """Initialize."""
         self._core_api = core_api
-        self._available_features = set()
+        self._available_features: frozenset[str] = frozenset()
         self._is_initialized = False
-
-    @staticmethod
-    def unauthorized_as_false(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs) -> bool:
-            try:
-                return await func(*args, **kwargs)
-            except ApiCallError as ace:
-                if ace.category == APICALL_ERRCAT_UNAUTHORIZED:
-                    return False
+        self._pending: dict[str, asyncio.Future] = {}
+
+    async def _get_shared(self, path: str) -> dict[str, Any]:
+        """Perform GET request, sharing the result with concurrent callers of the same path."""
+        pending = self._pending.get(path)
+        if pending is not None:
+            # a cancelled waiter must not cancel the request shared with others
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[path] = future
+        try:
+            result = await self._core_api.get(path)
+            if not future.done():
+                future.set_result(result)
+            return result
+        except Exception as ex:
+            if not future.done():
+                future.set_exception(ex)
+                # mark the exception as retrieved in case nobody else awaits it
+                future.exception()
+            raise
+        finally:
+            self._pending.pop(path, None)
+            # release the waiters when the request itself was cancelled
+            if not future.done():
+                future.cancel()
+
+    async def _probe(
+        self, feature_name: str, path: str, predicate: Callable[[Any], bool]
+    ) -> bool:
+        """Return true if the response of the path satisfies the predicate."""
+        _LOGGER.debug("Check feature '%s' availability", feature_name)
+        try:
+            result = predicate(await self._get_shared(path))
+        except ApiCallError as ace:
+            if ace.category != APICALL_ERRCAT_UNAUTHORIZED:
+                _LOGGER.debug("Feature availability check failed on %s", feature_name)
                 raise
+            result = False
+        except Exception:
+            _LOGGER.debug("Feature availability check failed on %s", feature_name)
+            raise
 
-        return wrapper
-
-    @staticmethod
-    def log_feature(feature_name: str):
-        def decorator(func):
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                try:
-                    _LOGGER.debug("Check feature '%s' availability", feature_name)
-                    result = await func(*args, **kwargs)
-                    if result:
-                        _LOGGER.debug("Feature '%s' is available", feature_name)
-                    else:
-                        _LOGGER.debug("Feature '%s' is not available", feature_name)
-                    return result
-                except Exception:
-                    _LOGGER.debug(
-                        "Feature availability check failed on %s", feature_name
-                    )
-                    raise
-
-            return wrapper
-
-        return decorator
+        if result:
+            _LOGGER.debug("Feature '%s' is available", feature_name)
+        else:
+            _LOGGER.debug("Feature '%s' is not available", feature_name)
+        return result
 
-    @log_feature(FEATURE_NFC)
-    @unauthorized_as_false
     async def _is_nfc_available(self) -> bool:
-        data = await self._core_api.get(_URL_SWITCH_NFC)
-        return data.get("nfcSwitch") is not None
+        return await self._probe(
+            FEATURE_NFC, _URL_SWITCH_NFC, lambda data: data.get("nfcSwitch") is not None
+        )
 
-    @log_feature(FEATURE_WIFI_80211R)
-    @unauthorized_as_false
     async def _is_wifi_80211r_available(self) -> bool:
-        data = await self._core_api.get(_URL_SWITCH_WIFI_80211R)
-        return data.get("WifiConfig", [{}])[0].get("Dot11REnable") is not None
+        return await self._probe(
+            FEATURE_WIFI_80211R,
+            _URL_SWITCH_WIFI_80211R,
+            lambda data: _has_wifi_config_value(data, "Dot11REnable"),
+        )
 
-    @log_feature(FEATURE_WIFI_TWT)
-    @unauthorized_as_false
     async def _is_wifi_twt_available(self) -> bool:
-        data = await self._core_api.get(_URL_SWITCH_WIFI_TWT)
-        return data.get("WifiConfig", [{}])[0].get("TWTEnable") is not None
+        return await self._probe(
+            FEATURE_WIFI_TWT,
+            _URL_SWITCH_WIFI_TWT,
+            lambda data: _has_wifi_config_value(data, "TWTEnable"),
+        )
 
-    @log_feature(FEATURE_WLAN_FILTER)
-    @unauthorized_as_false
     async def _is_wlan_filter_available(self) -> bool:
-        data = self._core_api.get(_URL_WLAN_FILTER)
-        return data is not None
+        return await self._probe(
+            FEATURE_WLAN_FILTER,
+            _URL_WLAN_FILTER,
+            lambda data: isinstance(data, list) and len(data) > 0,
+        )
 
     async def update(self) -> None:
         """Update the available features list."""
-        if await self._is_nfc_available():
-            self._available_features.add(FEATURE_NFC)
+        nfc, wifi_80211r, wifi_twt, wlan_filter = await _gather_all(
+            self._is_nfc_available(),
+            self._is_wifi_80211r_available(),
+            self._is_wifi_twt_available(),
+            self._is_wlan_filter_available(),
+        )
+
+        available_features = set(self._available_features)
 
-        if await self._is_wifi_80211r_available():
-            self._available_features.add(FEATURE_WIFI_80211R)
+        if nfc:
+            available_features.add(FEATURE_NFC)
 
-        if await self._is_wifi_twt_available():
-            self._available_features.add(FEATURE_WIFI_TWT)
+        if wifi_80211r:
+            available_features.add(FEATURE_WIFI_80211R)
 
-        if await self._is_wlan_filter_available():
-            self._available_features.add(FEATURE_WLAN_FILTER)
+        if wifi_twt:
+            available_features.add(FEATURE_WIFI_TWT)
+
+        if wlan_filter:
+            available_features.add(FEATURE_WLAN_FILTER)
+
+        self._available_features = frozenset(available_features)
 
     def is_available(self, feature: str) -> bool:
         """Return true if feature is available."""
@@ -181,7 +308,8 @@ class HuaweiApi:
         self._core_api = HuaweiCoreApi(host, port, use_ssl, user, password, verify_ssl)
         self._is_features_updated = False
         self._features = HuaweiFeaturesDetector(self._core_api)
-        self._logger = logging.getLogger(f"{__name__} ({host})")
+        self._filter_states_cache: tuple[float, Any] | None = None
+        self._logger = HostLoggerAdapter(_LOGGER, {"host": host})
         self._logger.debug("New instance of HuaweiApi created")
 
     async def authenticate(self) -> None:
@@ -192,6 +320,14 @@ class HuaweiApi:
         """Disconnect from api."""
         await self._core_api.disconnect()
 
+    async def __aenter__(self) -> "HuaweiApi":
+        """Return the api instance to use within the async context."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Disconnect when leaving the async context."""
+        await self.disconnect()
+
     async def _ensure_features_updated(self):
         if not self._is_features_updated:
             self._logger.debug("Updating available features")
@@ -209,6 +345,15 @@ class HuaweiApi:
         await self._ensure_features_updated()
         return self._features.is_available(feature)
 
+    @property
+    def features_ready(self) -> bool:
+        """Return true if available features are already detected."""
+        return self._is_features_updated
+
+    def is_feature_available_cached(self, feature: str) -> bool:
+        """Return true if features are already detected and specified one is available."""
+        return self._is_features_updated and self._features.is_available(feature)
+
     @staticmethod
     def _router_data_check_authorized(
         response: ClientResponse, result: dict[str, Any]
@@ -256,65 +401,100 @@ class HuaweiApi:
             address=data.get("ExternalIPAddress"),
         )
 
-    async def get_switch_state(self, name: str) -> bool:
-        """Return the specified switch state."""
-        await self._ensure_features_updated()
+    async def _write_nfc(self, state: bool) -> None:
+        await self._core_api.post(_URL_SWITCH_NFC, {"nfcSwitch": 1 if state else 0})
+
+    async def _write_wifi_80211r(self, state: bool) -> None:
+        await self._core_api.post(
+            _URL_SWITCH_WIFI_80211R,
+            {"Dot11REnable": state},
+            extra_data={"action": "11rSetting"},
+        )
 
-        if name == SWITCH_NFC and self._features.is_available(FEATURE_NFC):
-            data = await self._core_api.get(_URL_SWITCH_NFC)
-            return data.get("nfcSwitch") == 1
+    async def _write_wifi_twt(self, state: bool) -> None:
+        await self._core_api.post(
+            _URL_SWITCH_WIFI_TWT,
+            {"TWTEnable": state},
+            extra_data={"action": "TWTSetting"},
+        )
+
+    async def _write_wlan_filter(self, state: bool) -> None:
+        await self._set_wlan_filter_enabled(state)
+
+    _SWITCHES: Final[dict[str, _SwitchDefinition]] = {
+        SWITCH_NFC: _SwitchDefinition(
+            feature=FEATURE_NFC,
+            url=_URL_SWITCH_NFC,
+            read_state=lambda data: data.get("nfcSwitch") == 1,
+            write_state=_write_nfc,
+        ),
+        SWITCH_WIFI_80211R: _SwitchDefinition(
+            feature=FEATURE_WIFI_80211R,
+            url=_URL_SWITCH_WIFI_80211R,
+            read_state=lambda data: _read_wifi_config_flag(data, "Dot11REnable"),
+            write_state=_write_wifi_80211r,
+        ),
+        SWITCH_WIFI_TWT: _SwitchDefinition(
+            feature=FEATURE_WIFI_TWT,
+            url=_URL_SWITCH_WIFI_TWT,
+            read_state=lambda data: _read_wifi_config_flag(data, "TWTEnable"),
+            write_state=_write_wifi_twt,
+        ),
+        SWITCH_WLAN_FILTER: _SwitchDefinition(
+            feature=FEATURE_WLAN_FILTER,
+            url=_URL_WLAN_FILTER,
+            read_state=_read_wlan_filter_state,
+            write_state=_write_wlan_filter,
+        ),
+    }
+
+    def _get_switch(self, name: str) -> _SwitchDefinition:
+        """Return the definition of the available switch."""
+        switch = self._SWITCHES.get(name)
+        if switch is None or not self.is_feature_available_cached(switch.feature):
+            raise UnsupportedActionError(f"Unsupported switch name: {name}")
+        return switch
 
-        elif name == SWITCH_WIFI_80211R and self._features.is_available(
-            FEATURE_WIFI_80211R
-        ):
-            data = await self._core_api.get(_URL_SWITCH_WIFI_80211R)
-            setting_value = data.get("WifiConfig", [{}])[0].get("Dot11REnable")
-            return isinstance(setting_value, bool) and setting_value
+    async def get_switch_state(self, name: str) -> bool:
+        """Return the specified switch state."""
+        states = await self.get_switch_states([name])
+        return states[name]
 
-        elif name == SWITCH_WIFI_TWT and self._features.is_available(FEATURE_WIFI_TWT):
-            data = await self._core_api.get(_URL_SWITCH_WIFI_TWT)
-            setting_value = data.get("WifiConfig", [{}])[0].get("TWTEnable")
-            return isinstance(setting_value, bool) and setting_value
+    async def get_switch_states(self, names: Iterable[str]) -> dict[str, bool]:
+        """Return the specified switches states."""
+        await self._ensure_features_updated()
 
-        elif name == SWITCH_WLAN_FILTER and self._features.is_available(
-            FEATURE_WLAN_FILTER
-        ):
-            _, data = await self.get_wlan_filter_info()
-            return data.enabled
+        switches = {name: self._get_switch(name) for name in names}
+        unique_urls = list(dict.fromkeys(switch.url for switch in switches.values()))
+        results = await _gather_all(
+            *(
+                (
+                    self._get_filter_data()
+                    if url == _URL_WLAN_FILTER
+                    else self._core_api.get(url)
+                )
+                for url in unique_urls
+            )
+        )
+        data = dict(zip(unique_urls, results))
 
-        else:
-            raise UnsupportedActionError(f"Unsupported switch name: {name}")
+        return {
+            name: switch.read_state(data[switch.url])
+            for name, switch in switches.items()
+        }
 
     async def set_switch_state(self, name: str, state: bool) -> None:
         """Set the specified switch state."""
         await self._ensure_features_updated()
 
-        if name == SWITCH_NFC and self._features.is_available(FEATURE_NFC):
-            await self._core_api.post(_URL_SWITCH_NFC, {"nfcSwitch": 1 if state else 0})
-
-        elif name == SWITCH_WIFI_80211R and self._features.is_available(
-            FEATURE_WIFI_80211R
-        ):
-            await self._core_api.post(
-                _URL_SWITCH_WIFI_80211R,
-                {"Dot11REnable": state},
-                extra_data={"action": "11rSetting"},
-            )
-
-        elif name == SWITCH_WIFI_TWT and self._features.is_available(FEATURE_WIFI_TWT):
-            await self._core_api.post(
-                _URL_SWITCH_WIFI_TWT,
-                {"TWTEnable": state},
-                extra_data={"action": "TWTSetting"},
-            )
+        switch = self._get_switch(name)
 
-        elif name == SWITCH_WLAN_FILTER and self._features.is_available(
-            FEATURE_WLAN_FILTER
-        ):
-            await self._set_wlan_filter_enabled(state)
+        # wlan filter writer compares the state of both bands itself
+        if name != SWITCH_WLAN_FILTER and await self.get_switch_state(name) == state:
+            self._logger.debug("Switch %s is already %s", name, state)
+            return
 
-        else:
-            raise UnsupportedActionError(f"Unsupported switch name: {name}")
+        await switch.write_state(self, state)
 
     async def get_known_devices(self) -> Iterable[HuaweiClientDevice]:
         """Return the known devices."""
@@ -325,12 +505,18 @@ class HuaweiApi:
 
     @staticmethod
     def _get_device(node: dict[str, Any]) -> HuaweiDeviceNode:
-        device = HuaweiDeviceNode(node.get("MACAddress"), node.get("HiLinkType"))
-        connected_devices = node.get("ConnectedDevices", [])
-        for connected_device in connected_devices:
-            inner_node = HuaweiApi._get_device(connected_device)
-            device.add_device(inner_node)
-        return device
+        root = HuaweiDeviceNode(node.get("MACAddress"), node.get("HiLinkType"))
+        stack = [(node, root)]
+        while stack:
+            raw_node, device = stack.pop()
+            for connected_device in raw_node.get("ConnectedDevices", []):
+                inner_node = HuaweiDeviceNode(
+                    connected_device.get("MACAddress"),
+                    connected_device.get("HiLinkType"),
+                )
+                device.add_device(inner_node)
+                stack.append((connected_device, inner_node))
+        return root
 
     async def get_devices_topology(self) -> Iterable[HuaweiDeviceNode]:
         """Return the topology of the devices."""
@@ -362,7 +548,19 @@ class HuaweiApi:
                 _LOGGER.warning("WLAN Filtering is not enabled")
             return verification_result
 
+        known_devices: dict[MAC_ADDR, HuaweiClientDevice] | None = None
+
+        async def get_known_devices() -> dict[MAC_ADDR, HuaweiClientDevice]:
+            nonlocal known_devices
+            if known_devices is None:
+                known_devices = {}
+                for device in await self.get_known_devices():
+                    known_devices.setdefault(device.mac_address, device)
+            return known_devices
+
         state_2g, state_5g = await self._get_filter_states()
+        # access lists of the states are modified in place below
+        self._filter_states_cache = None
 
         if state_2g is None:
             _LOGGER.debug("Can not find actual 2.4GHz filter state")
@@ -377,14 +575,24 @@ class HuaweiApi:
             return False
 
         need_action_2g, whitelist_2g, blacklist_2g = await self._process_access_lists(
-            state_2g, filter_mode, filter_action, device_mac, device_name
+            state_2g,
+            filter_mode,
+            filter_action,
+            device_mac,
+            device_name,
+            get_known_devices,
         )
         if whitelist_2g is None or blacklist_2g is None or need_action_2g is None:
             _LOGGER.debug("Processing 2.4GHz filter failed")
             return False
 
         need_action_5g, whitelist_5g, blacklist_5g = await self._process_access_lists(
-            state_5g, filter_mode, filter_action, device_mac, device_name
+            state_5g,
+            filter_mode,
+            filter_action,
+            device_mac,
+            device_name,
+            get_known_devices,
         )
         if whitelist_5g is None or blacklist_5g is None or need_action_5g is None:
             _LOGGER.debug("Processing 5GHz filter failed")
@@ -394,24 +602,22 @@ class HuaweiApi:
             return True
 
         command = {
-            "config2g": {
-                "MACAddressControlEnabled": True,
-                "WMacFilters": whitelist_2g,
-                "ID": state_2g.get("ID"),
-                "MacFilterPolicy": state_2g.get("MacFilterPolicy"),
-                "BMacFilters": blacklist_2g,
-                "FrequencyBand": state_2g.get("FrequencyBand"),
-            },
-            "config5g": {
-                "MACAddressControlEnabled": True,
-                "WMacFilters": whitelist_5g,
-                "ID": state_5g.get("ID"),
-                "MacFilterPolicy": state_5g.get("MacFilterPolicy"),
-                "BMacFilters": blacklist_5g,
-                "FrequencyBand": state_5g.get("FrequencyBand"),
-            },
+            "config2g": _build_band_config(
+                state_2g,
+                MACAddressControlEnabled=True,
+                WMacFilters=whitelist_2g,
+                BMacFilters=blacklist_2g,
+            ),
+            "config5g": _build_band_config(
+                state_5g,
+                MACAddressControlEnabled=True,
+                WMacFilters=whitelist_5g,
+                BMacFilters=blacklist_5g,
+            ),
         }
 
+        # the router may apply the change even if the request fails
+        self._filter_states_cache = None
         await self._core_api.post(_URL_WLAN_FILTER, command)
         return True
 
@@ -440,24 +646,12 @@ class HuaweiApi:
             return True
 
         command = {
-            "config2g": {
-                "MACAddressControlEnabled": value,
-                "WMacFilters": state_2g.get("WMACAddresses"),
-                "ID": state_2g.get("ID"),
-                "MacFilterPolicy": state_2g.get("MacFilterPolicy"),
-                "BMacFilters": state_2g.get("BMACAddresses"),
-                "FrequencyBand": state_2g.get("FrequencyBand"),
-            },
-            "config5g": {
-                "MACAddressControlEnabled": value,
-                "WMacFilters": state_5g.get("WMACAddresses"),
-                "ID": state_5g.get("ID"),
-                "MacFilterPolicy": state_5g.get("MacFilterPolicy"),
-                "BMacFilters": state_5g.get("BMACAddresses"),
-                "FrequencyBand": state_5g.get("FrequencyBand"),
-            },
+            "config2g": _build_band_config(state_2g, MACAddressControlEnabled=value),
+            "config5g": _build_band_config(state_5g, MACAddressControlEnabled=value),
         }
 
+        # the router may apply the change even if the request fails
+        self._filter_states_cache = None
         await self._core_api.post(_URL_WLAN_FILTER, command)
         return True
 
@@ -480,24 +674,12 @@ class HuaweiApi:
             return True
 
         command = {
-            "config2g": {
-                "MACAddressControlEnabled": state_2g.get("MACAddressControlEnabled"),
-                "WMacFilters": state_2g.get("WMACAddresses"),
-                "ID": state_2g.get("ID"),
-                "MacFilterPolicy": value.value,
-                "BMacFilters": state_2g.get("BMACAddresses"),
-                "FrequencyBand": state_2g.get("FrequencyBand"),
-            },
-            "config5g": {
-                "MACAddressControlEnabled": state_5g.get("MACAddressControlEnabled"),
-                "WMacFilters": state_5g.get("WMACAddresses"),
-                "ID": state_5g.get("ID"),
-                "MacFilterPolicy": value.value,
-                "BMacFilters": state_5g.get("BMACAddresses"),
-                "FrequencyBand": state_5g.get("FrequencyBand"),
-            },
+            "config2g": _build_band_config(state_2g, MacFilterPolicy=value.value),
+            "config5g": _build_band_config(state_5g, MacFilterPolicy=value.value),
         }
 
+        # the router may apply the change even if the request fails
+        self._filter_states_cache = None
         await self._core_api.post(_URL_WLAN_FILTER, command)
         return True
 
@@ -507,17 +689,19 @@ class HuaweiApi:
         info_5g = HuaweiFilterInfo.parse(state_5g)
         return info_2g, info_5g
 
+    async def _get_filter_data(self) -> Any:
+        """Return the raw filter states, reusing the recently fetched ones."""
+        if self._filter_states_cache is not None:
+            timestamp, data = self._filter_states_cache
+            if time.monotonic() - timestamp < _FILTER_STATES_CACHE_TTL:
+                return data
+        data = await self._core_api.get(_URL_WLAN_FILTER)
+        self._filter_states_cache = (time.monotonic(), data)
+        return data
+
     async def _get_filter_states(self):
-        actual_states = await self._core_api.get(_URL_WLAN_FILTER)
-        state_2g = None
-        state_5g = None
-        for state in actual_states:
-            frequency = state.get("FrequencyBand")
-            if frequency == "2.4GHz":
-                state_2g = state
-            elif frequency == "5GHz":
-                state_5g = state
-        return state_2g, state_5g
+        actual_states = await self._get_filter_data()
+        return _find_filter_states(actual_states)
 
     async def _process_access_lists(
         self,
@@ -526,6 +710,7 @@ class HuaweiApi:
         filter_action: FilterAction,
         device_mac: MAC_ADDR,
         device_name: str | None,
+        get_known_devices: Callable[[], Awaitable[dict[MAC_ADDR, HuaweiClientDevice]]],
     ) -> (bool | None, dict[str, Any] | None, dict[str, Any] | None):
         """Return (need_action, whitelist, blacklist)"""
         whitelist = state.get("WMACAddresses")
@@ -543,10 +728,10 @@ class HuaweiApi:
             if device_name:
                 return {"MACAddress": device_mac, "HostName": device_name}
             # search for HostName if no item popped and no name provided
-            known_devices = await self.get_known_devices()
-            for device in known_devices:
-                if device.mac_address == device_mac:
-                    return {"MACAddress": device_mac, "HostName": device.actual_name}
+            known_devices = await get_known_devices()
+            device = known_devices.get(device_mac)
+            if device is not None:
+                return {"MACAddress": device_mac, "HostName": device.actual_name}
             _LOGGER.debug("Can not find known device '%s'", device_mac)
             return {
                 "MACAddress": device_mac,
@@ -560,28 +745,22 @@ class HuaweiApi:
         # | REMOVE       | WHITELIST  |  Remove  |  None  |
         # | REMOVE       | BLACKLIST  |   None   | Remove |
 
-        whitelist_index: int | None = None
-        blacklist_index: int | None = None
+        whitelist_index: int | None = _index_by_mac(whitelist).get(device_mac)
+        blacklist_index: int | None = _index_by_mac(blacklist).get(device_mac)
 
-        for index in range(len(whitelist)):
-            if device_mac == whitelist[index].get("MACAddress"):
-                whitelist_index = index
-                _LOGGER.debug(
-                    "Device '%s' found at %s whitelist",
-                    device_mac,
-                    state.get("FrequencyBand"),
-                )
-                break
-
-        for index in range(len(blacklist)):
-            if device_mac == blacklist[index].get("MACAddress"):
-                blacklist_index = index
-                _LOGGER.debug(
-                    "Device '%s' found at %s blacklist",
-                    device_mac,
-                    state.get("FrequencyBand"),
-                )
-                break
+        if whitelist_index is not None:
+            _LOGGER.debug(
+                "Device '%s' found at %s whitelist",
+                device_mac,
+                state.get("FrequencyBand"),
+            )
+
+        if blacklist_index is not None:
+            _LOGGER.debug(
+                "Device '%s' found at %s blacklist",
+                device_mac,
+                state.get("FrequencyBand"),
+            )
 
         if filter_action == FilterAction.REMOVE:
 
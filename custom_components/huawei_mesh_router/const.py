@@ -30,11 +30,11 @@ DEFAULT_DEVICES_TAGS: Final = False
 DEFAULT_DEVICE_TRACKER: Final = True
 
 ATTR_MANUFACTURER: Final = "Huawei"
-PLATFORMS: Final = [
+PLATFORMS: Final = (
     Platform.SWITCH,
     Platform.DEVICE_TRACKER,
     Platform.SENSOR,
     Platform.BUTTON,
     Platform.BINARY_SENSOR,
     Platform.SELECT,
-]
+)
@@ -525,25 +525,24 @@ class HuaweiControllerDataUpdateCoordinator(DataUpdateCoordinator):
 
         new_states: dict[str, bool] = {}
 
+        primary_switches: list[str] = []
+
         if await primary_api.is_feature_available(FEATURE_WIFI_80211R):
-            state = await primary_api.get_switch_state(SWITCH_WIFI_80211R)
-            new_states[SWITCH_WIFI_80211R] = state
-            _LOGGER.debug("80211r switch state updated to %s", state)
+            primary_switches.append(SWITCH_WIFI_80211R)
 
         if await primary_api.is_feature_available(FEATURE_WIFI_TWT):
-            state = await primary_api.get_switch_state(SWITCH_WIFI_TWT)
-            new_states[SWITCH_WIFI_TWT] = state
-            _LOGGER.debug("TWT switch state updated to %s", state)
+            primary_switches.append(SWITCH_WIFI_TWT)
 
         if await primary_api.is_feature_available(FEATURE_NFC):
-            state = await primary_api.get_switch_state(SWITCH_NFC)
-            new_states[SWITCH_NFC] = state
-            _LOGGER.debug("Nfc switch (primary router) state updated to %s", state)
+            primary_switches.append(SWITCH_NFC)
 
         if await primary_api.is_feature_available(FEATURE_WLAN_FILTER):
-            state = await primary_api.get_switch_state(SWITCH_WLAN_FILTER)
-            new_states[SWITCH_WLAN_FILTER] = state
-            _LOGGER.debug("WLan filter switch state updated to %s", state)
+            primary_switches.append(SWITCH_WLAN_FILTER)
+
+        if primary_switches:
+            states = await primary_api.get_switch_states(primary_switches)
+            new_states.update(states)
+            _LOGGER.debug("Primary router switches states updated to %s", states)
 
         for mac, api in self._apis.items():
             device = self._connected_devices.get(mac)